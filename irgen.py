@@ -1,22 +1,50 @@
 class IRGenerator:
+    __slots__ = ("module", "function", "scope")
+
     def __init__(self):
+        cls = type(self)
+        if "_handlers" not in cls.__dict__:
+            cls._handlers = cls.__collect_handlers()
         self.module = None
         # self.module.tripple 
         self.function = None
         self.scope = None
-        
+
+    @classmethod
+    def __collect_handlers(cls):
+        """Map each node type to its _<type> function"""
+        return {
+            name[1:]: getattr(cls, name)
+            for name in dir(cls)
+            if name.startswith("_") and "__" not in name and name != "_"
+            and callable(getattr(cls, name))
+        }
 
     def generate(self, ast):
         self._(ast)
         return str(self.module)
 
     def _(self, node):
-        return getattr(self, f"_{node[0]}","__generic")(node)
+        if isinstance(node, list):
+            return self.__generic(node)
+        handler = self._handlers.get(node[0])
+        if handler is None:
+            return self.__generic(node)
+        return handler(self, node)
 
     def __generic(self, node):
-        for child in node if isinstance(node, list) else node[1]:
-            if isinstance(child, tuple):
-                self._(child)
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            if current is not node and isinstance(current, tuple):
+                handler = self._handlers.get(current[0])
+                if handler is not None:
+                    handler(self, current)
+                    continue
+            children = current if isinstance(current, list) else current[1:]
+            stack.extend(
+                child for child in reversed(children) if isinstance(child, (list, tuple))
+            )
 
     def _declare(self, node):
         pass
@@ -42,7 +70,7 @@ class IRGenerator:
     def _spread(self, node):
         pass
 
-    def _modifier(sel, nodef)
+    def _modifier(self, node):
         pass
 
     def _pass(self, node):
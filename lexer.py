@@ -1,4 +1,5 @@
 import re
+from sys import intern
 import ply.lex as lex
 
 keywords = {
@@ -144,6 +145,7 @@ def t_BOOLEAN(t):
 
 def t_ID(t):
     r"[a-zA-Z_][a-zA-Z0-9_]*"
+    t.value = intern(t.value)
     t.type = keywords.get(t.value, "ID")
     return t
 
@@ -183,6 +185,6 @@ def sanitize(data):
     return re.sub(multiple_newlines_regex, sanitized_newline, data.lstrip())
 
 
-lexer = lex.lex()
+lexer = lex.lex(reflags=re.VERBOSE | re.ASCII)
 input_function = lexer.input
 lexer.input = lambda data: input_function(sanitize(data))
@@ -15,7 +15,8 @@ def p_stmts(p):
     if len(p) == 2:
         p[0] = [p[1]]
     else:
-        p[0] = p[1] + [p[2]]
+        p[1].append(p[2])
+        p[0] = p[1]
 
 
 def p_stmt(p):
@@ -106,7 +107,8 @@ def p_enum_items(p):
     elif len(p) == 2:
         p[0] = [p[1]]
     else:
-        p[0] = p[1] + [p[3]]
+        p[1].append(p[3])
+        p[0] = p[1]
 
 
 def p_array_lit(p):
@@ -119,15 +121,25 @@ def p_array_lit(p):
 def p_array_items(p):
     """
     array_items :
-                | expr
-                | expr COMMA  array_items
+                | expr_list
+                | expr_list COMMA
     """
     if len(p) == 1:
         p[0] = []
-    elif len(p) == 2:
+    else:
+        p[0] = p[1]
+
+
+def p_expr_list(p):
+    """
+    expr_list : expr
+              | expr_list COMMA expr
+    """
+    if len(p) == 2:
         p[0] = [p[1]]
     else:
-        p[0] = [p[1]] + p[3]
+        p[1].append(p[3])
+        p[0] = p[1]
 
 
 def p_index(p):
@@ -209,7 +221,8 @@ def p_when_stmt(p):
     if len(p) == 2:
         p[0] = ("when_stmt", p[1])
     else:
-        p[0] = ("when_stmt", p[1] + [p[2]])
+        p[1].append(p[2])
+        p[0] = ("when_stmt", p[1])
 
 
 def p_when_blocks(p):
@@ -220,7 +233,8 @@ def p_when_blocks(p):
     if len(p) == 2:
         p[0] = [p[1]]
     else:
-        p[0] = p[1] + [p[2]]
+        p[1].append(p[2])
+        p[0] = p[1]
 
 
 def p_when_block(p):
@@ -368,7 +382,8 @@ def p_params(p):
     elif len(p) == 2:
         p[0] = [p[1]]
     else:
-        p[0] = p[1] + [p[3]]
+        p[1].append(p[3])
+        p[0] = p[1]
 
 
 def p_param(p):
@@ -390,7 +405,8 @@ def p_args(p):
     elif len(p) == 2:
         p[0] = [p[1]]
     else:
-        p[0] = p[1] + [p[3]]
+        p[1].append(p[3])
+        p[0] = p[1]
 
 
 def p_type(p):
@@ -440,7 +456,8 @@ def p_dict_items(p):
     if len(p) == 3:
         p[0] = [p[1]]
     else:
-        p[0] = p[1] + [p[2]]
+        p[1].append(p[2])
+        p[0] = p[1]
 
 def p_dict_item(p):
     """
@@ -462,6 +479,6 @@ def ensure_newline_at_end(data):
     return data
 
 
-parser = yacc.yacc()
+parser = yacc.yacc(debug=False)
 parser_function = parser.parse
 parser.parse = lambda data: parser_function(ensure_newline_at_end(data))
@@ -0,0 +1,137 @@
+
+# parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'ARROW AT BOOL BOOLEAN BREAK COLON COMMA DEDENT DEFAULT DOT DOUBLE DOUBLEL DOUBLE_AMP DOUBLE_DOT DOUBLE_MINUS DOUBLE_PLUS DOUBLE_STAR DOUBLE_STAR_EQUALS DOUBLE_VBAR ENUM EQ EQUALS EXCLAMATION EXTENDS GT GTE ID IN INDENT INT INTEGER LBRACE LBRACKET LOOP LPAR LT LTE MINUS MINUS_EQUALS MOD MOD_EQUALS NEQ NEWLINE PASS PLUS PLUS_EQUALS QUESTION RBRACE RBRACKET RETURN RPAR SEMICOLON SLASH SLASH_EQUALS STAR STAR_EQUALS STR STRING STRUCT UNTIL VOID WHENprogram : stmts\n    stmts : stmt\n          | stmts stmt\n    \n    stmt : simple_stmt NEWLINE\n         | compound_stmt\n    \n    simple_stmt : declare\n                | assign\n                | declare_assign\n                | enum_declare\n                | return_stmt\n                | pass_stmt\n    \n    compound_stmt : func_declare\n                  | when_stmt\n                  | loop_stmt\n                  | until_stmt\n                  | struct\n                  | struct_constructor\n    declare : type IDassign : ID assign_op exprassign : expr assign_op expr\n    assign_op : EQUALS\n              | PLUS_EQUALS\n              | MINUS_EQUALS\n              | STAR_EQUALS\n              | SLASH_EQUALS\n              | MOD_EQUALS\n              | DOUBLE_STAR_EQUALS\n    declare_assign : type ID EQUALS expr\n    lambda_func : LPAR params RPAR ARROW expr\n    enum_declare : ENUM ID LBRACE enum_items RBRACE\n    enum_items :\n               | ID\n               | enum_items COMMA ID\n    \n    expr : LBRACKET array_items  RBRACKET\n    \n    array_items :\n                | expr_list\n                | expr_list COMMA\n    \n    expr_list : expr\n              | expr_list COMMA expr\n    \n    expr : expr LBRACKET expr RBRACKET\n    \n    expr : STAR expr\n    \n    modifier : AT expr\n    \n    pass_stmt : PASS\n    \n    return_stmt : RETURN\n                | RETURN expr\n    \n    block : NEWLINE INDENT stmts DEDENT\n    \n    func_declare : type ID LPAR params RPAR COLON block\n    \n    struct : STRUCT ID COLON block\n           | STRUCT ID EXTENDS ID COLON block\n    \n    struct_constructor : LPAR params RPAR COLON block\n    \n    when_stmt : when_blocks\n              | when_blocks default_block\n    \n    when_blocks : when_block\n                | when_blocks when_block\n    \n    when_block : WHEN expr COLON block\n    \n    default_block : DEFAULT COLON block\n    \n    loop_stmt : LOOP declare IN expr COLON block\n    \n    until_stmt : UNTIL expr COLON block\n    \n    expr : ID LPAR args RPAR\n    \n    expr : expr PLUS expr\n         | expr MINUS expr\n         | expr SLASH expr\n         | expr STAR expr\n         | expr MOD expr\n         | expr DOUBLE_STAR expr\n    \n    expr : DOUBLE_PLUS ID\n         | DOUBLE_MINUS ID\n    \n    expr : EXCLAMATION expr\n    expr : expr DOUBLE_AMP exprexpr : expr DOUBLE_VBAR expr\n    expr : expr EQ expr\n         | expr NEQ expr\n         | expr LT expr\n         | expr GT expr\n         | expr LTE expr\n         | expr GTE expr\n    expr : expr QUESTION expr EXCLAMATION exprexpr : LPAR expr RPARexpr : expr DOT exprexpr : INTEGERexpr : STRINGexpr : BOOLEANexpr : DOUBLELexpr : IDexpr : LPAR type RPAR exprexpr : expr DOUBLE_DOT expr\n    params :\n           | param\n           | params COMMA param\n    \n    param : declare\n          | declare_assign\n    \n    args :\n         | expr\n         | args COMMA expr\n    \n    type : primitive\n         | composed\n    \n    primitive : INT\n              | STR\n              | BOOL\n              | DOUBLE\n              | VOID\n    \n    composed : array\n    \n    array : type LBRACKET RBRACKET\n    \n    dict_lit : LBRACE NEWLINE INDENT dict_items DEDENT RBRACE\n    \n    dict_items : dict_item NEWLINE\n               | dict_items dict_item NEWLINE\n    \n    dict_item : ID COLON expr\n    '
+    
+_lr_action_items = {'ID':([0,2,3,5,12,13,14,15,16,17,18,21,22,24,25,27,28,29,30,31,32,33,34,35,40,41,42,43,44,45,46,47,48,49,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,83,86,90,91,94,105,107,130,135,138,142,144,147,150,152,158,161,162,165,170,171,172,177,178,179,180,181,],[19,19,-2,-5,-12,-13,-14,-15,-16,-17,50,80,82,82,-51,82,96,-95,-96,82,82,101,102,82,-53,-97,-98,-99,-100,-101,-102,82,-3,-4,82,82,-21,-22,-23,-24,-25,-26,-27,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,136,-52,-54,139,82,-103,153,82,82,163,82,136,82,82,-56,-58,-48,-55,176,-50,19,19,-57,-49,-47,-46,]),'ENUM':([0,2,3,5,12,13,14,15,16,17,25,40,48,49,90,91,158,161,162,165,171,172,177,178,179,180,181,],[21,21,-2,-5,-12,-13,-14,-15,-16,-17,-51,-53,-3,-4,-52,-54,-56,-58,-48,-55,-50,21,21,-57,-49,-47,-46,]),'RETURN':([0,2,3,5,12,13,14,15,16,17,25,40,48,49,90,91,158,161,162,165,171,172,177,178,179,180,181,],[22,22,-2,-5,-12,-13,-14,-15,-16,-17,-51,-53,-3,-4,-52,-54,-56,-58,-48,-55,-50,22,22,-57,-49,-47,-46,]),'PASS':([0,2,3,5,12,13,14,15,16,17,25,40,48,49,90,91,158,161,162,165,171,172,177,178,179,180,181,],[23,23,-2,-5,-12,-13,-14,-15,-16,-17,-51,-53,-3,-4,-52,-54,-56,-58,-48,-55,-50,23,23,-57,-49,-47,-46,]),'LOOP':([0,2,3,5,12,13,14,15,16,17,25,40,48,49,90,91,158,161,162,165,171,172,177,178,179,180,181,],[26,26,-2,-5,-12,-13,-14,-15,-16,-17,-51,-53,-3,-4,-52,-54,-56,-58,-48,-55,-50,26,26,-57,-49,-47,-46,]),'UNTIL':([0,2,3,5,12,13,14,15,16,17,25,40,48,49,90,91,158,161,162,165,171,172,177,178,179,180,181,],[27,27,-2,-5,-12,-13,-14,-15,-16,-17,-51,-53,-3,-4,-52,-54,-56,-58,-48,-55,-50,27,27,-57,-49,-47,-46,]),'STRUCT':([0,2,3,5,12,13,14,15,16,17,25,40,48,49,90,91,158,161,162,165,171,172,177,178,179,180,181,],[28,28,-2,-5,-12,-13,-14,-15,-16,-17,-51,-53,-3,-4,-52,-54,-56,-58,-48,-55,-50,28,28,-57,-49,-47,-46,]),'LPAR':([0,2,3,5,12,13,14,15,16,17,19,22,24,25,27,31,32,35,40,47,48,49,50,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,82,83,90,91,105,135,138,144,150,152,158,161,162,165,171,172,177,178,179,180,181,],[24,24,-2,-5,-12,-13,-14,-15,-16,-17,53,83,83,-51,83,83,83,83,-53,83,-3,-4,106,83,83,-21,-22,-23,-24,-25,-26,-27,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,53,83,-52,-54,83,83,83,83,83,83,-56,-58,-48,-55,-50,24,24,-57,-49,-47,-46,]),'LBRACKET':([0,2,3,5,12,13,14,15,16,17,18,19,20,22,24,25,27,29,30,31,32,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,82,83,85,86,90,91,94,95,99,100,101,102,103,104,105,107,108,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,131,134,135,138,143,144,146,147,149,150,151,152,157,158,160,161,162,164,165,167,168,171,172,177,178,179,180,181,],[31,31,-2,-5,-12,-13,-14,-15,-16,-17,51,-84,62,31,31,-51,31,-95,-96,31,31,31,-80,-81,-82,-83,-53,-97,-98,-99,-100,-101,-102,31,-3,-4,31,31,-21,-22,-23,-24,-25,-26,-27,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,62,-84,31,62,51,-52,-54,51,62,62,62,-66,-67,62,62,31,-103,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,51,-78,31,31,-34,31,62,51,-59,31,-40,31,62,-56,62,-58,-48,62,-55,62,62,-50,31,31,-57,-49,-47,-46,]),'STAR':([0,2,3,5,12,13,14,15,16,17,19,20,22,24,25,27,31,32,35,36,37,38,39,40,47,48,49,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,82,83,85,90,91,95,99,100,101,102,103,104,105,108,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,134,135,138,143,144,146,149,150,151,152,157,158,160,161,162,164,165,167,168,171,172,177,178,179,180,181,],[32,32,-2,-5,-12,-13,-14,-15,-16,-17,-84,66,32,32,-51,32,32,32,32,-80,-81,-82,-83,-53,32,-3,-4,32,32,-21,-22,-23,-24,-25,-26,-27,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,66,-84,32,66,-52,-54,66,66,66,-66,-67,66,66,32,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,-78,32,32,-34,32,66,-59,32,-40,32,66,-56,66,-58,-48,66,-55,66,66,-50,32,32,-57,-49,-47,-46,]),'DOUBLE_PLUS':([0,2,3,5,12,13,14,15,16,17,22,24,25,27,31,32,35,40,47,48,49,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,83,90,91,105,135,138,144,150,152,158,161,162,165,171,172,177,178,179,180,181,],[33,33,-2,-5,-12,-13,-14,-15,-16,-17,33,33,-51,33,33,33,33,-53,33,-3,-4,33,33,-21,-22,-23,-24,-25,-26,-27,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,-52,-54,33,33,33,33,33,33,-56,-58,-48,-55,-50,33,33,-57,-49,-47,-46,]),'DOUBLE_MINUS':([0,2,3,5,12,13,14,15,16,17,22,24,25,27,31,32,35,40,47,48,49,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,83,90,91,105,135,138,144,150,152,158,161,162,165,171,172,177,178,179,180,181,],[34,34,-2,-5,-12,-13,-14,-15,-16,-17,34,34,-51,34,34,34,34,-53,34,-3,-4,34,34,-21,-22,-23,-24,-25,-26,-27,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,-52,-54,34,34,34,34,34,34,-56,-58,-48,-55,-50,34,34,-57,-49,-47,-46,]),'EXCLAMATION':([0,2,3,5,12,13,14,15,16,17,22,24,25,27,31,32,35,36,37,38,39,40,47,48,49,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,82,83,90,91,100,101,102,103,105,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,134,135,138,143,144,149,150,151,152,157,158,161,162,165,168,171,172,177,178,179,180,181,],[35,35,-2,-5,-12,-13,-14,-15,-16,-17,35,35,-51,35,35,35,35,-80,-81,-82,-83,-53,35,-3,-4,35,35,-21,-22,-23,-24,-25,-26,-27,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,-84,35,-52,-54,-41,-66,-67,-68,35,-60,-61,-62,-63,-64,-65,-69,-70,-71,-72,-73,-74,-75,-76,152,-79,-86,-78,35,35,-34,35,-59,35,-40,35,-85,-56,-58,-48,-55,-77,-50,35,35,-57,-49,-47,-46,]),'INTEGER':([0,2,3,5,12,13,14,15,16,17,22,24,25,27,31,32,35,40,47,48,49,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,83,90,91,105,135,138,144,150,152,158,161,162,165,171,172,177,178,179,180,181,],[36,36,-2,-5,-12,-13,-14,-15,-16,-17,36,36,-51,36,36,36,36,-53,36,-3,-4,36,36,-21,-22,-23,-24,-25,-26,-27,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,-52,-54,36,36,36,36,36,36,-56,-58,-48,-55,-50,36,36,-57,-49,-47,-46,]),'STRING':([0,2,3,5,12,13,14,15,16,17,22,24,25,27,31,32,35,40,47,48,49,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,83,90,91,105,135,138,144,150,152,158,161,162,165,171,172,177,178,179,180,181,],[37,37,-2,-5,-12,-13,-14,-15,-16,-17,37,37,-51,37,37,37,37,-53,37,-3,-4,37,37,-21,-22,-23,-24,-25,-26,-27,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,-52,-54,37,37,37,37,37,37,-56,-58,-48,-55,-50,37,37,-57,-49,-47,-46,]),'BOOLEAN':([0,2,3,5,12,13,14,15,16,17,22,24,25,27,31,32,35,40,47,48,49,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,83,90,91,105,135,138,144,150,152,158,161,162,165,171,172,177,178,179,180,181,],[38,38,-2,-5,-12,-13,-14,-15,-16,-17,38,38,-51,38,38,38,38,-53,38,-3,-4,38,38,-21,-22,-23,-24,-25,-26,-27,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,-52,-54,38,38,38,38,38,38,-56,-58,-48,-55,-50,38,38,-57,-49,-47,-46,]),'DOUBLEL':([0,2,3,5,12,13,14,15,16,17,22,24,25,27,31,32,35,40,47,48,49,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,83,90,91,105,135,138,144,150,152,158,161,162,165,171,172,177,178,179,180,181,],[39,39,-2,-5,-12,-13,-14,-15,-16,-17,39,39,-51,39,39,39,39,-53,39,-3,-4,39,39,-21,-22,-23,-24,-25,-26,-27,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,-52,-54,39,39,39,39,39,39,-56,-58,-48,-55,-50,39,39,-57,-49,-47,-46,]),'INT':([0,2,3,5,12,13,14,15,16,17,24,25,26,40,48,49,83,90,91,106,133,158,161,162,165,171,172,177,178,179,180,181,],[41,41,-2,-5,-12,-13,-14,-15,-16,-17,41,-51,41,-53,-3,-4,41,-52,-54,41,41,-56,-58,-48,-55,-50,41,41,-57,-49,-47,-46,]),'STR':([0,2,3,5,12,13,14,15,16,17,24,25,26,40,48,49,83,90,91,106,133,158,161,162,165,171,172,177,178,179,180,181,],[42,42,-2,-5,-12,-13,-14,-15,-16,-17,42,-51,42,-53,-3,-4,42,-52,-54,42,42,-56,-58,-48,-55,-50,42,42,-57,-49,-47,-46,]),'BOOL':([0,2,3,5,12,13,14,15,16,17,24,25,26,40,48,49,83,90,91,106,133,158,161,162,165,171,172,177,178,179,180,181,],[43,43,-2,-5,-12,-13,-14,-15,-16,-17,43,-51,43,-53,-3,-4,43,-52,-54,43,43,-56,-58,-48,-55,-50,43,43,-57,-49,-47,-46,]),'DOUBLE':([0,2,3,5,12,13,14,15,16,17,24,25,26,40,48,49,83,90,91,106,133,158,161,162,165,171,172,177,178,179,180,181,],[44,44,-2,-5,-12,-13,-14,-15,-16,-17,44,-51,44,-53,-3,-4,44,-52,-54,44,44,-56,-58,-48,-55,-50,44,44,-57,-49,-47,-46,]),'VOID':([0,2,3,5,12,13,14,15,16,17,24,25,26,40,48,49,83,90,91,106,133,158,161,162,165,171,172,177,178,179,180,181,],[45,45,-2,-5,-12,-13,-14,-15,-16,-17,45,-51,45,-53,-3,-4,45,-52,-54,45,45,-56,-58,-48,-55,-50,45,45,-57,-49,-47,-46,]),'WHEN':([0,2,3,5,12,13,14,15,16,17,25,40,48,49,90,91,158,161,162,165,171,172,177,178,179,180,181,],[47,47,-2,-5,-12,-13,-14,-15,-16,-17,47,-53,-3,-4,-52,-54,-56,-58,-48,-55,-50,47,47,-57,-49,-47,-46,]),'$end':([1,2,3,5,12,13,14,15,16,17,25,40,48,49,90,91,158,161,162,165,171,178,179,180,181,],[0,-1,-2,-5,-12,-13,-14,-15,-16,-17,-51,-53,-3,-4,-52,-54,-56,-58,-48,-55,-50,-57,-49,-47,-46,]),'DEDENT':([3,5,12,13,14,15,16,17,25,40,48,49,90,91,158,161,162,165,171,177,178,179,180,181,],[-2,-5,-12,-13,-14,-15,-16,-17,-51,-53,-3,-4,-52,-54,-56,-58,-48,-55,-50,181,-57,-49,-47,-46,]),'NEWLINE':([4,6,7,8,9,10,11,22,23,36,37,38,39,50,81,82,100,101,102,103,108,111,113,114,115,116,117,118,119,120,121,122,123,124,125,126,128,129,134,137,140,141,143,145,146,149,151,155,157,168,169,173,174,175,],[49,-6,-7,-8,-9,-10,-11,-44,-43,-80,-81,-82,-83,-18,-45,-84,-41,-66,-67,-68,-19,-20,-60,-61,-62,-63,-64,-65,-69,-70,-71,-72,-73,-74,-75,-76,-79,-86,-78,159,159,159,-34,159,-28,-59,-40,159,-85,-77,-30,159,159,159,]),'PLUS':([19,20,36,37,38,39,81,82,85,95,99,100,101,102,103,104,108,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,134,143,146,149,151,157,160,164,167,168,],[-84,63,-80,-81,-82,-83,63,-84,63,63,63,63,-66,-67,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,-78,-34,63,-59,-40,63,63,63,63,63,]),'MINUS':([19,20,36,37,38,39,81,82,85,95,99,100,101,102,103,104,108,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,134,143,146,149,151,157,160,164,167,168,],[-84,64,-80,-81,-82,-83,64,-84,64,64,64,64,-66,-67,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,-78,-34,64,-59,-40,64,64,64,64,64,]),'SLASH':([19,20,36,37,38,39,81,82,85,95,99,100,101,102,103,104,108,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,134,143,146,149,151,157,160,164,167,168,],[-84,65,-80,-81,-82,-83,65,-84,65,65,65,65,-66,-67,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,-78,-34,65,-59,-40,65,65,65,65,65,]),'MOD':([19,20,36,37,38,39,81,82,85,95,99,100,101,102,103,104,108,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,134,143,146,149,151,157,160,164,167,168,],[-84,67,-80,-81,-82,-83,67,-84,67,67,67,67,-66,-67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,-78,-34,67,-59,-40,67,67,67,67,67,]),'DOUBLE_STAR':([19,20,36,37,38,39,81,82,85,95,99,100,101,102,103,104,108,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,134,143,146,149,151,157,160,164,167,168,],[-84,68,-80,-81,-82,-83,68,-84,68,68,68,68,-66,-67,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,-78,-34,68,-59,-40,68,68,68,68,68,]),'DOUBLE_AMP':([19,20,36,37,38,39,81,82,85,95,99,100,101,102,103,104,108,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,134,143,146,149,151,157,160,164,167,168,],[-84,69,-80,-81,-82,-83,69,-84,69,69,69,69,-66,-67,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,-78,-34,69,-59,-40,69,69,69,69,69,]),'DOUBLE_VBAR':([19,20,36,37,38,39,81,82,85,95,99,100,101,102,103,104,108,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,134,143,146,149,151,157,160,164,167,168,],[-84,70,-80,-81,-82,-83,70,-84,70,70,70,70,-66,-67,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,-78,-34,70,-59,-40,70,70,70,70,70,]),'EQ':([19,20,36,37,38,39,81,82,85,95,99,100,101,102,103,104,108,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,134,143,146,149,151,157,160,164,167,168,],[-84,71,-80,-81,-82,-83,71,-84,71,71,71,71,-66,-67,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,-78,-34,71,-59,-40,71,71,71,71,71,]),'NEQ':([19,20,36,37,38,39,81,82,85,95,99,100,101,102,103,104,108,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,134,143,146,149,151,157,160,164,167,168,],[-84,72,-80,-81,-82,-83,72,-84,72,72,72,72,-66,-67,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,-78,-34,72,-59,-40,72,72,72,72,72,]),'LT':([19,20,36,37,38,39,81,82,85,95,99,100,101,102,103,104,108,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,134,143,146,149,151,157,160,164,167,168,],[-84,73,-80,-81,-82,-83,73,-84,73,73,73,73,-66,-67,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,-78,-34,73,-59,-40,73,73,73,73,73,]),'GT':([19,20,36,37,38,39,81,82,85,95,99,100,101,102,103,104,108,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,134,143,146,149,151,157,160,164,167,168,],[-84,74,-80,-81,-82,-83,74,-84,74,74,74,74,-66,-67,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,-78,-34,74,-59,-40,74,74,74,74,74,]),'LTE':([19,20,36,37,38,39,81,82,85,95,99,100,101,102,103,104,108,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,134,143,146,149,151,157,160,164,167,168,],[-84,75,-80,-81,-82,-83,75,-84,75,75,75,75,-66,-67,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,-78,-34,75,-59,-40,75,75,75,75,75,]),'GTE':([19,20,36,37,38,39,81,82,85,95,99,100,101,102,103,104,108,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,134,143,146,149,151,157,160,164,167,168,],[-84,76,-80,-81,-82,-83,76,-84,76,76,76,76,-66,-67,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,-78,-34,76,-59,-40,76,76,76,76,76,]),'QUESTION':([19,20,36,37,38,39,81,82,85,95,99,100,101,102,103,104,108,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,134,143,146,149,151,157,160,164,167,168,],[-84,77,-80,-81,-82,-83,77,-84,77,77,77,77,-66,-67,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,-78,-34,77,-59,-40,77,77,77,77,77,]),'DOT':([19,20,36,37,38,39,81,82,85,95,99,100,101,102,103,104,108,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,134,143,146,149,151,157,160,164,167,168,],[-84,78,-80,-81,-82,-83,78,-84,78,78,78,78,-66,-67,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,-78,-34,78,-59,-40,78,78,78,78,78,]),'DOUBLE_DOT':([19,20,36,37,38,39,81,82,85,95,99,100,101,102,103,104,108,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,134,143,146,149,151,157,160,164,167,168,],[-84,79,-80,-81,-82,-83,79,-84,79,79,79,79,-66,-67,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,-78,-34,79,-59,-40,79,79,79,79,79,]),'EQUALS':([19,20,36,37,38,39,50,82,100,101,102,103,113,114,115,116,117,118,119,120,121,122,123,124,125,126,128,129,134,136,143,149,151,157,168,],[54,54,-80,-81,-82,-83,105,-84,-41,-66,-67,-68,-60,-61,-62,-63,-64,-65,-69,-70,-71,-72,-73,-74,-75,-76,-79,-86,-78,105,-34,-59,-40,-85,-77,]),'PLUS_EQUALS':([19,20,36,37,38,39,82,100,101,102,103,113,114,115,116,117,118,119,120,121,122,123,124,125,126,128,129,134,143,149,151,157,168,],[55,55,-80,-81,-82,-83,-84,-41,-66,-67,-68,-60,-61,-62,-63,-64,-65,-69,-70,-71,-72,-73,-74,-75,-76,-79,-86,-78,-34,-59,-40,-85,-77,]),'MINUS_EQUALS':([19,20,36,37,38,39,82,100,101,102,103,113,114,115,116,117,118,119,120,121,122,123,124,125,126,128,129,134,143,149,151,157,168,],[56,56,-80,-81,-82,-83,-84,-41,-66,-67,-68,-60,-61,-62,-63,-64,-65,-69,-70,-71,-72,-73,-74,-75,-76,-79,-86,-78,-34,-59,-40,-85,-77,]),'STAR_EQUALS':([19,20,36,37,38,39,82,100,101,102,103,113,114,115,116,117,118,119,120,121,122,123,124,125,126,128,129,134,143,149,151,157,168,],[57,57,-80,-81,-82,-83,-84,-41,-66,-67,-68,-60,-61,-62,-63,-64,-65,-69,-70,-71,-72,-73,-74,-75,-76,-79,-86,-78,-34,-59,-40,-85,-77,]),'SLASH_EQUALS':([19,20,36,37,38,39,82,100,101,102,103,113,114,115,116,117,118,119,120,121,122,123,124,125,126,128,129,134,143,149,151,157,168,],[58,58,-80,-81,-82,-83,-84,-41,-66,-67,-68,-60,-61,-62,-63,-64,-65,-69,-70,-71,-72,-73,-74,-75,-76,-79,-86,-78,-34,-59,-40,-85,-77,]),'MOD_EQUALS':([19,20,36,37,38,39,82,100,101,102,103,113,114,115,116,117,118,119,120,121,122,123,124,125,126,128,129,134,143,149,151,157,168,],[59,59,-80,-81,-82,-83,-84,-41,-66,-67,-68,-60,-61,-62,-63,-64,-65,-69,-70,-71,-72,-73,-74,-75,-76,-79,-86,-78,-34,-59,-40,-85,-77,]),'DOUBLE_STAR_EQUALS':([19,20,36,37,38,39,82,100,101,102,103,113,114,115,116,117,118,119,120,121,122,123,124,125,126,128,129,134,143,149,151,157,168,],[60,60,-80,-81,-82,-83,-84,-41,-66,-67,-68,-60,-61,-62,-63,-64,-65,-69,-70,-71,-72,-73,-74,-75,-76,-79,-86,-78,-34,-59,-40,-85,-77,]),'RPAR':([24,29,30,36,37,38,39,41,42,43,44,45,46,53,82,84,85,86,87,88,89,100,101,102,103,106,107,109,110,113,114,115,116,117,118,119,120,121,122,123,124,125,126,128,129,131,134,136,143,146,148,149,151,156,157,167,168,],[-87,-95,-96,-80,-81,-82,-83,-97,-98,-99,-100,-101,-102,-92,-84,132,134,135,-88,-90,-91,-41,-66,-67,-68,-87,-103,149,-93,-60,-61,-62,-63,-64,-65,-69,-70,-71,-72,-73,-74,-75,-76,-79,-86,135,-78,-18,-34,-28,166,-59,-40,-89,-85,-94,-77,]),'COMMA':([24,36,37,38,39,53,82,84,87,88,89,98,99,100,101,102,103,106,109,110,113,114,115,116,117,118,119,120,121,122,123,124,125,126,128,129,130,134,136,143,146,148,149,151,153,154,156,157,164,167,168,176,],[-87,-80,-81,-82,-83,-92,-84,133,-88,-90,-91,144,-38,-41,-66,-67,-68,-87,150,-93,-60,-61,-62,-63,-64,-65,-69,-70,-71,-72,-73,-74,-75,-76,-79,-86,-31,-78,-18,-34,-28,133,-59,-40,-32,170,-89,-85,-39,-94,-77,-33,]),'DEFAULT':([25,40,91,165,181,],[92,-53,-54,-55,-46,]),'RBRACKET':([31,36,37,38,39,51,82,97,98,99,100,101,102,103,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,128,129,134,143,144,149,151,157,164,168,],[-35,-80,-81,-82,-83,107,-84,143,-36,-38,-41,-66,-67,-68,151,-60,-61,-62,-63,-64,-65,-69,-70,-71,-72,-73,-74,-75,-76,-79,-86,-78,-34,-37,-59,-40,-85,-39,-77,]),'COLON':([36,37,38,39,82,92,95,96,100,101,102,103,104,113,114,115,116,117,118,119,120,121,122,123,124,125,126,128,129,132,134,143,149,151,157,160,163,166,168,],[-80,-81,-82,-83,-84,137,140,141,-41,-66,-67,-68,145,-60,-61,-62,-63,-64,-65,-69,-70,-71,-72,-73,-74,-75,-76,-79,-86,155,-78,-34,-59,-40,-85,173,174,175,-77,]),'LBRACE':([80,],[130,]),'IN':([93,139,],[138,-18,]),'EXTENDS':([96,],[142,]),'RBRACE':([130,153,154,176,],[-31,-32,169,-33,]),'INDENT':([159,],[172,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'program':([0,],[1,]),'stmts':([0,172,],[2,177,]),'stmt':([0,2,172,177,],[3,48,3,48,]),'simple_stmt':([0,2,172,177,],[4,4,4,4,]),'compound_stmt':([0,2,172,177,],[5,5,5,5,]),'declare':([0,2,24,26,106,133,172,177,],[6,6,88,93,88,88,6,6,]),'assign':([0,2,172,177,],[7,7,7,7,]),'declare_assign':([0,2,24,106,133,172,177,],[8,8,89,89,89,8,8,]),'enum_declare':([0,2,172,177,],[9,9,9,9,]),'return_stmt':([0,2,172,177,],[10,10,10,10,]),'pass_stmt':([0,2,172,177,],[11,11,11,11,]),'func_declare':([0,2,172,177,],[12,12,12,12,]),'when_stmt':([0,2,172,177,],[13,13,13,13,]),'loop_stmt':([0,2,172,177,],[14,14,14,14,]),'until_stmt':([0,2,172,177,],[15,15,15,15,]),'struct':([0,2,172,177,],[16,16,16,16,]),'struct_constructor':([0,2,172,177,],[17,17,17,17,]),'type':([0,2,24,26,83,106,133,172,177,],[18,18,86,94,131,147,147,18,18,]),'expr':([0,2,22,24,27,31,32,35,47,52,53,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,83,105,135,138,144,150,152,172,177,],[20,20,81,85,95,99,100,103,104,108,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,85,146,157,160,164,167,168,20,20,]),'when_blocks':([0,2,172,177,],[25,25,25,25,]),'primitive':([0,2,24,26,83,106,133,172,177,],[29,29,29,29,29,29,29,29,29,]),'composed':([0,2,24,26,83,106,133,172,177,],[30,30,30,30,30,30,30,30,30,]),'when_block':([0,2,25,172,177,],[40,40,91,40,40,]),'array':([0,2,24,26,83,106,133,172,177,],[46,46,46,46,46,46,46,46,46,]),'assign_op':([19,20,],[52,61,]),'params':([24,106,],[84,148,]),'param':([24,106,133,],[87,87,156,]),'default_block':([25,],[90,]),'array_items':([31,],[97,]),'expr_list':([31,],[98,]),'args':([53,],[109,]),'enum_items':([130,],[154,]),'block':([137,140,141,145,155,173,174,175,],[158,161,162,165,171,178,179,180,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> program","S'",1,None,None,None),
+  ('program -> stmts','program',1,'p_program','parser.py',6),
+  ('stmts -> stmt','stmts',1,'p_stmts','parser.py',12),
+  ('stmts -> stmts stmt','stmts',2,'p_stmts','parser.py',13),
+  ('stmt -> simple_stmt NEWLINE','stmt',2,'p_stmt','parser.py',24),
+  ('stmt -> compound_stmt','stmt',1,'p_stmt','parser.py',25),
+  ('simple_stmt -> declare','simple_stmt',1,'p_simple_stmt','parser.py',32),
+  ('simple_stmt -> assign','simple_stmt',1,'p_simple_stmt','parser.py',33),
+  ('simple_stmt -> declare_assign','simple_stmt',1,'p_simple_stmt','parser.py',34),
+  ('simple_stmt -> enum_declare','simple_stmt',1,'p_simple_stmt','parser.py',35),
+  ('simple_stmt -> return_stmt','simple_stmt',1,'p_simple_stmt','parser.py',36),
+  ('simple_stmt -> pass_stmt','simple_stmt',1,'p_simple_stmt','parser.py',37),
+  ('compound_stmt -> func_declare','compound_stmt',1,'p_compound_stmt','parser.py',44),
+  ('compound_stmt -> when_stmt','compound_stmt',1,'p_compound_stmt','parser.py',45),
+  ('compound_stmt -> loop_stmt','compound_stmt',1,'p_compound_stmt','parser.py',46),
+  ('compound_stmt -> until_stmt','compound_stmt',1,'p_compound_stmt','parser.py',47),
+  ('compound_stmt -> struct','compound_stmt',1,'p_compound_stmt','parser.py',48),
+  ('compound_stmt -> struct_constructor','compound_stmt',1,'p_compound_stmt','parser.py',49),
+  ('declare -> type ID','declare',2,'p_declare','parser.py',55),
+  ('assign -> ID assign_op expr','assign',3,'p_assign','parser.py',60),
+  ('assign -> expr assign_op expr','assign',3,'p_assign_access','parser.py',65),
+  ('assign_op -> EQUALS','assign_op',1,'p_assign_op','parser.py',71),
+  ('assign_op -> PLUS_EQUALS','assign_op',1,'p_assign_op','parser.py',72),
+  ('assign_op -> MINUS_EQUALS','assign_op',1,'p_assign_op','parser.py',73),
+  ('assign_op -> STAR_EQUALS','assign_op',1,'p_assign_op','parser.py',74),
+  ('assign_op -> SLASH_EQUALS','assign_op',1,'p_assign_op','parser.py',75),
+  ('assign_op -> MOD_EQUALS','assign_op',1,'p_assign_op','parser.py',76),
+  ('assign_op -> DOUBLE_STAR_EQUALS','assign_op',1,'p_assign_op','parser.py',77),
+  ('declare_assign -> type ID EQUALS expr','declare_assign',4,'p_declare_assign','parser.py',83),
+  ('lambda_func -> LPAR params RPAR ARROW expr','lambda_func',5,'p_lambda_func','parser.py',89),
+  ('enum_declare -> ENUM ID LBRACE enum_items RBRACE','enum_declare',5,'p_enum_declare','parser.py',95),
+  ('enum_items -> <empty>','enum_items',0,'p_enum_items','parser.py',101),
+  ('enum_items -> ID','enum_items',1,'p_enum_items','parser.py',102),
+  ('enum_items -> enum_items COMMA ID','enum_items',3,'p_enum_items','parser.py',103),
+  ('expr -> LBRACKET array_items RBRACKET','expr',3,'p_array_lit','parser.py',116),
+  ('array_items -> <empty>','array_items',0,'p_array_items','parser.py',123),
+  ('array_items -> expr_list','array_items',1,'p_array_items','parser.py',124),
+  ('array_items -> expr_list COMMA','array_items',2,'p_array_items','parser.py',125),
+  ('expr_list -> expr','expr_list',1,'p_expr_list','parser.py',135),
+  ('expr_list -> expr_list COMMA expr','expr_list',3,'p_expr_list','parser.py',136),
+  ('expr -> expr LBRACKET expr RBRACKET','expr',4,'p_index','parser.py',147),
+  ('expr -> STAR expr','expr',2,'p_spread','parser.py',154),
+  ('modifier -> AT expr','modifier',2,'p_modifier','parser.py',161),
+  ('pass_stmt -> PASS','pass_stmt',1,'p_pass_stmt','parser.py',168),
+  ('return_stmt -> RETURN','return_stmt',1,'p_return_stmt','parser.py',175),
+  ('return_stmt -> RETURN expr','return_stmt',2,'p_return_stmt','parser.py',176),
+  ('block -> NEWLINE INDENT stmts DEDENT','block',4,'p_block','parser.py',186),
+  ('func_declare -> type ID LPAR params RPAR COLON block','func_declare',7,'p_func_declare','parser.py',193),
+  ('struct -> STRUCT ID COLON block','struct',4,'p_struct','parser.py',200),
+  ('struct -> STRUCT ID EXTENDS ID COLON block','struct',6,'p_struct','parser.py',201),
+  ('struct_constructor -> LPAR params RPAR COLON block','struct_constructor',5,'p_struct_constructor','parser.py',211),
+  ('when_stmt -> when_blocks','when_stmt',1,'p_when_stmt','parser.py',218),
+  ('when_stmt -> when_blocks default_block','when_stmt',2,'p_when_stmt','parser.py',219),
+  ('when_blocks -> when_block','when_blocks',1,'p_when_blocks','parser.py',230),
+  ('when_blocks -> when_blocks when_block','when_blocks',2,'p_when_blocks','parser.py',231),
+  ('when_block -> WHEN expr COLON block','when_block',4,'p_when_block','parser.py',242),
+  ('default_block -> DEFAULT COLON block','default_block',3,'p_default_block','parser.py',249),
+  ('loop_stmt -> LOOP declare IN expr COLON block','loop_stmt',6,'p_loop_stmt','parser.py',256),
+  ('until_stmt -> UNTIL expr COLON block','until_stmt',4,'p_until_stmt','parser.py',263),
+  ('expr -> ID LPAR args RPAR','expr',4,'p_expr_func_call','parser.py',270),
+  ('expr -> expr PLUS expr','expr',3,'p_expr_binop','parser.py',277),
+  ('expr -> expr MINUS expr','expr',3,'p_expr_binop','parser.py',278),
+  ('expr -> expr SLASH expr','expr',3,'p_expr_binop','parser.py',279),
+  ('expr -> expr STAR expr','expr',3,'p_expr_binop','parser.py',280),
+  ('expr -> expr MOD expr','expr',3,'p_expr_binop','parser.py',281),
+  ('expr -> expr DOUBLE_STAR expr','expr',3,'p_expr_binop','parser.py',282),
+  ('expr -> DOUBLE_PLUS ID','expr',2,'p_expr_unary','parser.py',289),
+  ('expr -> DOUBLE_MINUS ID','expr',2,'p_expr_unary','parser.py',290),
+  ('expr -> EXCLAMATION expr','expr',2,'p_expr_logic_not','parser.py',297),
+  ('expr -> expr DOUBLE_AMP expr','expr',3,'p_epxr_logic_and','parser.py',303),
+  ('expr -> expr DOUBLE_VBAR expr','expr',3,'p_epxr_logic_or','parser.py',308),
+  ('expr -> expr EQ expr','expr',3,'p_expr_comop','parser.py',314),
+  ('expr -> expr NEQ expr','expr',3,'p_expr_comop','parser.py',315),
+  ('expr -> expr LT expr','expr',3,'p_expr_comop','parser.py',316),
+  ('expr -> expr GT expr','expr',3,'p_expr_comop','parser.py',317),
+  ('expr -> expr LTE expr','expr',3,'p_expr_comop','parser.py',318),
+  ('expr -> expr GTE expr','expr',3,'p_expr_comop','parser.py',319),
+  ('expr -> expr QUESTION expr EXCLAMATION expr','expr',5,'p_expr_conop','parser.py',325),
+  ('expr -> LPAR expr RPAR','expr',3,'p_expr_group','parser.py',330),
+  ('expr -> expr DOT expr','expr',3,'p_expr_access','parser.py',335),
+  ('expr -> INTEGER','expr',1,'p_expr_integer','parser.py',340),
+  ('expr -> STRING','expr',1,'p_expr_string','parser.py',345),
+  ('expr -> BOOLEAN','expr',1,'p_expr_boolean','parser.py',350),
+  ('expr -> DOUBLEL','expr',1,'p_expr_double','parser.py',355),
+  ('expr -> ID','expr',1,'p_expr_id','parser.py',360),
+  ('expr -> LPAR type RPAR expr','expr',4,'p_expr_cast','parser.py',365),
+  ('expr -> expr DOUBLE_DOT expr','expr',3,'p_expr_range','parser.py',370),
+  ('params -> <empty>','params',0,'p_params','parser.py',376),
+  ('params -> param','params',1,'p_params','parser.py',377),
+  ('params -> params COMMA param','params',3,'p_params','parser.py',378),
+  ('param -> declare','param',1,'p_param','parser.py',391),
+  ('param -> declare_assign','param',1,'p_param','parser.py',392),
+  ('args -> <empty>','args',0,'p_args','parser.py',399),
+  ('args -> expr','args',1,'p_args','parser.py',400),
+  ('args -> args COMMA expr','args',3,'p_args','parser.py',401),
+  ('type -> primitive','type',1,'p_type','parser.py',414),
+  ('type -> composed','type',1,'p_type','parser.py',415),
+  ('primitive -> INT','primitive',1,'p_type_primitive','parser.py',422),
+  ('primitive -> STR','primitive',1,'p_type_primitive','parser.py',423),
+  ('primitive -> BOOL','primitive',1,'p_type_primitive','parser.py',424),
+  ('primitive -> DOUBLE','primitive',1,'p_type_primitive','parser.py',425),
+  ('primitive -> VOID','primitive',1,'p_type_primitive','parser.py',426),
+  ('composed -> array','composed',1,'p_type_composed','parser.py',433),
+  ('array -> type LBRACKET RBRACKET','array',3,'p_array','parser.py',440),
+  ('dict_lit -> LBRACE NEWLINE INDENT dict_items DEDENT RBRACE','dict_lit',6,'p_dict_lit','parser.py',447),
+  ('dict_items -> dict_item NEWLINE','dict_items',2,'p_dict_items','parser.py',453),
+  ('dict_items -> dict_items dict_item NEWLINE','dict_items',3,'p_dict_items','parser.py',454),
+  ('dict_item -> ID COLON expr','dict_item',3,'p_dict_item','parser.py',464),
+]
@@ -1,3 +0,0 @@
-class Scope:
-   def __init__(self):
-    
\ No newline at end of file
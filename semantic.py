@@ -1,51 +1,115 @@
+INT = "int"
+DOUBLE = "double"
+BOOL = "bool"
+STR = "str"
+VOID = "void"
+RANGE = "range"
+ENUM = "enum"
+
+_ARITH_OPS = frozenset({"+", "-", "*", "/"})
+_CMP_OPS = frozenset({"==", "!=", "<", ">", "<=", ">="})
+_LOGIC_OPS = frozenset({"&&", "||"})
+_INCDEC_OPS = frozenset({"++", "--"})
+
+# Leaf node types, resolved directly in analyze_node
+_LITERAL_TYPES = {"integer": INT, "string": STR, "boolean": BOOL, "doublel": DOUBLE}
+
+
+def array_of(element_type):
+    """Return the array type whose elements are element_type, as the parser builds it"""
+    return ("array", element_type)
+
+
+def element_of(type_):
+    """Return the element type of an array type, or None if type_ is not an array"""
+    if type(type_) is tuple and len(type_) == 2 and type_[0] == "array":
+        return type_[1]
+    return None
+
+
 class SemanticError(Exception):
     pass
 
 
+_UNBOUND = object()  # Marks a name that had no binding before a scope declared it
+
+
 class SymbolTable:
+    __slots__ = ("symbols", "scopes")
+
     def __init__(self):
-        self.scopes = [{}]  # Stack of scopes, starting with global scope
+        self.symbols = {}  # Every visible name mapped to its innermost type
+        self.scopes = [{}]  # Per scope: declared name -> binding it shadows
 
     def enter_scope(self):
         self.scopes.append({})
 
     def exit_scope(self):
-        self.scopes.pop()
+        if len(self.scopes) == 1:
+            raise SemanticError("Cannot exit the global scope")
+        symbols = self.symbols
+        for name, shadowed in self.scopes.pop().items():
+            if shadowed is _UNBOUND:
+                del symbols[name]
+            else:
+                symbols[name] = shadowed
 
     def declare(self, name, type_):
-        if name in self.scopes[-1]:
+        scope = self.scopes[-1]
+        if name in scope:
             raise SemanticError(f"Variable {name} already declared in current scope")
-        self.scopes[-1][name] = type_
+        scope[name] = self.symbols.get(name, _UNBOUND)
+        self.symbols[name] = type_
 
     def lookup(self, name):
-        for scope in reversed(self.scopes):
-            if name in scope:
-                return scope[name]
-        raise SemanticError(f"Variable {name} not declared")
+        try:
+            return self.symbols[name]
+        except KeyError:
+            raise SemanticError(f"Variable {name} not declared") from None
 
 
 class SemanticAnalyzer:
+    __slots__ = ("symbol_table", "current_function")
+
     def __init__(self):
+        cls = type(self)
+        if "_handlers" not in cls.__dict__:
+            cls._handlers = cls._collect_handlers()
         self.symbol_table = SymbolTable()
         self.current_function = None
 
+    @classmethod
+    def _collect_handlers(cls):
+        """Map each node type to its analyze_* function"""
+        return {
+            name[len("analyze_"):]: getattr(cls, name)
+            for name in dir(cls)
+            if name.startswith("analyze_") and name != "analyze_node"
+        }
+
     def analyze(self, ast):
         """Main entry point for semantic analysis"""
         for node in ast:
             self.analyze_node(node)
 
     def analyze_node(self, node):
-        if not isinstance(node, tuple):
+        if type(node) is not tuple:
             return
 
         node_type = node[0]
 
+        # Leaves are typed inline, without a handler call
+        literal_type = _LITERAL_TYPES.get(node_type)
+        if literal_type is not None:
+            return literal_type
+        if node_type == "id":
+            return self.symbol_table.lookup(node[1])
+
         # Dispatch to appropriate handler method
-        method_name = f"analyze_{node_type}"
-        if hasattr(self, method_name):
-            return getattr(self, method_name)(node)
-        else:
+        handler = self._handlers.get(node_type)
+        if handler is None:
             raise SemanticError(f"Unknown node type: {node_type}")
+        return handler(self, node)
 
     def analyze_declare(self, node):
         _, type_, name = node
@@ -69,28 +133,30 @@ class SemanticAnalyzer:
 
     def analyze_func_declare(self, node):
         _, return_type, name, params, body = node
-        self.symbol_table.declare(
+        symbol_table = self.symbol_table
+        analyze_node = self.analyze_node
+        symbol_table.declare(
             name, ("function", return_type, [p[1] for p in params])
         )
 
         # Create new scope for function body
-        self.symbol_table.enter_scope()
+        symbol_table.enter_scope()
         self.current_function = return_type
 
         # Declare parameters in new scope
         for param in params:
-            self.analyze_node(param)
+            analyze_node(param)
 
         # Analyze function body
         for stmt in body:
-            self.analyze_node(stmt)
+            analyze_node(stmt)
 
         self.current_function = None
-        self.symbol_table.exit_scope()
+        symbol_table.exit_scope()
 
     def analyze_return(self, node):
         if len(node) == 1:  # return without expression
-            expr_type = "void"
+            expr_type = VOID
         else:
             expr_type = self.analyze_node(node[1])
 
@@ -108,17 +174,20 @@ class SemanticAnalyzer:
         if not isinstance(func_type, tuple) or func_type[0] != "function":
             raise SemanticError(f"{name} is not a function")
 
-        if len(args) != len(func_type[2]):
+        _, return_type, param_types = func_type
+        if len(args) != len(param_types):
             raise SemanticError(f"Wrong number of arguments for function {name}")
 
-        for arg, param_type in zip(args, func_type[2]):
-            arg_type = self.analyze_node(arg)
-            if not self.type_compatible(param_type, arg_type):
+        analyze_node = self.analyze_node
+        type_compatible = self.type_compatible
+        for arg, param_type in zip(args, param_types):
+            arg_type = analyze_node(arg)
+            if not type_compatible(param_type, arg_type):
                 raise SemanticError(
                     f"Argument type mismatch: expected {param_type}, got {arg_type}"
                 )
 
-        return func_type[1]  # Return type
+        return return_type
 
     def analyze_binop(self, node):
         _, op, left, right = node
@@ -132,76 +201,69 @@ class SemanticAnalyzer:
 
         return self.result_type(op, left_type, right_type)
 
-    def analyze_id(self, node):
-        _, name = node
-        return self.symbol_table.lookup(name)
-
-    def analyze_integer(self, node):
-        return "int"
-
-    def analyze_string(self, node):
-        return "str"
-
-    def analyze_boolean(self, node):
-        return "bool"
-
-    def analyze_doublel(self, node):
-        return "double"
-
-    def type_compatible(self, expected, actual):
+    @staticmethod
+    def type_compatible(expected, actual):
         """Check if actual type can be assigned to expected type"""
         if expected == actual:
             return True
 
         # Add type conversion rules here
         # For example: int can be assigned to double
-        if expected == "double" and actual == "int":
+        if expected == DOUBLE and actual == INT:
             return True
 
         return False
 
-    def result_type(self, op, left_type, right_type):
+    @staticmethod
+    def result_type(op, left_type, right_type):
         """Determine result type of binary operations"""
-        if op in ["+", "-", "*", "/"]:
-            if left_type == "double" or right_type == "double":
-                return "double"
-            return "int"
-        elif op in ["==", "!=", "<", ">", "<=", ">="]:
-            return "bool"
-        elif op == "&&" or op == "||":
-            if left_type == "bool" and right_type == "bool":
-                return "bool"
+        if op in _ARITH_OPS:
+            if left_type == DOUBLE or right_type == DOUBLE:
+                return DOUBLE
+            return INT
+        elif op in _CMP_OPS:
+            return BOOL
+        elif op in _LOGIC_OPS:
+            if left_type == BOOL and right_type == BOOL:
+                return BOOL
             raise SemanticError(f"Logical operators require boolean operands")
 
         raise SemanticError(f"Unknown operator: {op}")
 
     def analyze_enum_declare(self, node):
         _, name, items = node
-        self.symbol_table.declare(name, "enum")
+        declare = self.symbol_table.declare
+        declare(name, ENUM)
         for item in items:
-            self.symbol_table.declare(item, name)
+            declare(item, name)
 
     def analyze_array_lit(self, node):
         _, items = node
-        item_types = [self.analyze_node(item) for item in items]
-        if not all(t == item_types[0] for t in item_types):
-            raise SemanticError("Array elements must be of the same type")
-        return f"array[{item_types[0]}]"
+        if not items:
+            raise SemanticError("Cannot infer the type of an empty array literal")
+        analyze_node = self.analyze_node
+        remaining = iter(items)
+        item_type = analyze_node(next(remaining))
+        for item in remaining:
+            if analyze_node(item) != item_type:
+                raise SemanticError("Array elements must be of the same type")
+        return array_of(item_type)
 
     def analyze_index(self, node):
         _, array, index = node
         array_type = self.analyze_node(array)
         index_type = self.analyze_node(index)
-        if not array_type.startswith("array["):
+        element_type = element_of(array_type)
+        if element_type is None:
             raise SemanticError("Indexing is only supported on arrays")
-        if index_type != "int":
+        if index_type != INT:
             raise SemanticError("Array index must be an integer")
-        return array_type[6:-1]  # Return the type of the array elements
+        return element_type
 
     def analyze_spread(self, node):
         _, expr = node
         expr_type = self.analyze_node(expr)
-        if not expr_type.startswith("array["):
+        if element_of(expr_type) is None:
             raise SemanticError("Spread operator is only supported on arrays")
         return expr_type
 
@@ -221,52 +283,54 @@ class SemanticAnalyzer:
         _, var_decl, iterable, body = node
         self.analyze_node(var_decl)
         iterable_type = self.analyze_node(iterable)
-        if not iterable_type.startswith("array["):
+        if element_of(iterable_type) is None:
             raise SemanticError("Loop iterable must be an array")
-        self.symbol_table.enter_scope()
+        symbol_table = self.symbol_table
+        symbol_table.enter_scope()
         self.analyze_node(body)
-        self.symbol_table.exit_scope()
+        symbol_table.exit_scope()
 
     def analyze_until(self, node):
         _, condition, body = node
         condition_type = self.analyze_node(condition)
-        if condition_type != "bool":
+        if condition_type != BOOL:
             raise SemanticError("Until condition must be a boolean")
-        self.symbol_table.enter_scope()
+        symbol_table = self.symbol_table
+        symbol_table.enter_scope()
         self.analyze_node(body)
-        self.symbol_table.exit_scope()
+        symbol_table.exit_scope()
 
     def analyze_unary(self, node):
         _, op, operand = node
         operand_type = self.analyze_node(operand)
-        if op in ["++", "--"]:
-            if operand_type != "int":
+        if op in _INCDEC_OPS:
+            if operand_type != INT:
                 raise SemanticError(f"Unary operator {op} requires integer operand")
-            return "int"
+            return INT
         raise SemanticError(f"Unknown unary operator: {op}")
 
     def analyze_logic_not(self, node):
         _, expr = node
         expr_type = self.analyze_node(expr)
-        if expr_type != "bool":
+        if expr_type != BOOL:
             raise SemanticError("Logical NOT operator requires boolean operand")
-        return "bool"
+        return BOOL
 
     def analyze_logic_and(self, node):
         _, left, right = node
         left_type = self.analyze_node(left)
         right_type = self.analyze_node(right)
-        if left_type != "bool" or right_type != "bool":
+        if left_type != BOOL or right_type != BOOL:
             raise SemanticError("Logical AND operator requires boolean operands")
-        return "bool"
+        return BOOL
 
     def analyze_logic_or(self, node):
         _, left, right = node
         left_type = self.analyze_node(left)
         right_type = self.analyze_node(right)
-        if left_type != "bool" or right_type != "bool":
+        if left_type != BOOL or right_type != BOOL:
             raise SemanticError("Logical OR operator requires boolean operands")
-        return "bool"
+        return BOOL
 
     def analyze_comop(self, node):
         _, op, left, right = node
@@ -274,14 +338,14 @@ class SemanticAnalyzer:
         right_type = self.analyze_node(right)
         if not self.type_compatible(left_type, right_type):
             raise SemanticError(f"Type mismatch in comparison: {left_type} {op} {right_type}")
-        return "bool"
+        return BOOL
 
     def analyze_conop(self, node):
         _, condition, true_expr, false_expr = node
         condition_type = self.analyze_node(condition)
         true_type = self.analyze_node(true_expr)
         false_type = self.analyze_node(false_expr)
-        if condition_type != "bool":
+        if condition_type != BOOL:
             raise SemanticError("Conditional operator requires boolean condition")
         if not self.type_compatible(true_type, false_type):
             raise SemanticError(f"Type mismatch in conditional operator: {true_type} vs {false_type}")
@@ -297,6 +361,6 @@ class SemanticAnalyzer:
         _, start, end = node
         start_type = self.analyze_node(start)
         end_type = self.analyze_node(end)
-        if start_type != "int" or end_type != "int":
+        if start_type != INT or end_type != INT:
             raise SemanticError("Range bounds must be integers")
-        return "range"
+        return RANGE
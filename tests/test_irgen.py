@@ -0,0 +1,46 @@
+import sys
+from irgen import IRGenerator
+
+
+class RecordingGenerator(IRGenerator):
+    def __init__(self):
+        super().__init__()
+        self.visited = []
+
+    def _id(self, node):
+        self.visited.append(node[1])
+
+    def _assign(self, node):
+        self.visited.append(("assign", node[1]))
+
+
+def test_unhandled_nodes_visit_children_in_order():
+    generator = RecordingGenerator()
+    ast = [
+        ("unknown", ("id", "a"), [("id", "b"), ("other", ("id", "c"))]),
+        ("id", "d"),
+    ]
+    generator.generate(ast)
+    assert generator.visited == ["a", "b", "c", "d"]
+
+
+def test_handled_nodes_are_not_walked():
+    generator = RecordingGenerator()
+    ast = [("assign", "x", "=", ("id", "y")), ("id", "z")]
+    generator.generate(ast)
+    assert generator.visited == [("assign", "x"), "z"]
+
+
+def test_handled_root_node_is_dispatched():
+    generator = RecordingGenerator()
+    generator._(("assign", "x", "=", ("id", "y")))
+    assert generator.visited == [("assign", "x")]
+
+
+def test_deep_ast_does_not_recurse():
+    node = ("id", "leaf")
+    for _ in range(sys.getrecursionlimit() * 2):
+        node = ("unknown", node)
+    generator = RecordingGenerator()
+    generator.generate([node])
+    assert generator.visited == ["leaf"]
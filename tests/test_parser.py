@@ -13,12 +13,16 @@ def test_simple_declaration():
     assert result == [("declare", "int", "x")]
 
 
-def test_multiple_declarations():
-    code = """
+MULTIPLE_DECLARATIONS = normalize(
+    """
     int x
     str y
     """
-    result = parser.parse(normalize(code))
+)
+
+
+def test_multiple_declarations():
+    result = parser.parse(MULTIPLE_DECLARATIONS)
     assert result == [("declare", "int", "x"), ("declare", "str", "y")]
 
 
@@ -28,12 +32,11 @@ def test_assignment():
     assert result == [("assign", "x", "=", ("integer", "42"))]
 
 
-def test_compound_assignment():
-    operators = ["+=", "-=", "*=", "/=", "%=", "**="]
-    for op in operators:
-        code = f"x {op} 5\n"
-        result = parser.parse(code)
-        assert result == [("assign", "x", op, ("integer", "5"))]
+@pytest.mark.parametrize("op", ["+=", "-=", "*=", "/=", "%=", "**="])
+def test_compound_assignment(op):
+    code = f"x {op} 5\n"
+    result = parser.parse(code)
+    assert result == [("assign", "x", op, ("integer", "5"))]
 
 
 def test_declare_assign():
@@ -48,12 +51,16 @@ def test_enum_declaration():
     assert result == [("enum_declare", "Color", ["RED", "GREEN", "BLUE"])]
 
 
-def test_function_declaration():
-    code = """
+FUNCTION_DECLARATION = normalize(
+    """
     int add(int x, int y):
         return x
     """
-    result = parser.parse(normalize(code))
+)
+
+
+def test_function_declaration():
+    result = parser.parse(FUNCTION_DECLARATION)
     assert result == [
         (
             "func_declare",
@@ -78,27 +85,40 @@ def test_array_literals():
     ]
 
 
+def test_array_literal_trailing_comma():
+    result = parser.parse("x = [1,]\n")
+    assert result == [("assign", "x", "=", ("array_lit", [("integer", "1")]))]
+
+
+def test_array_literal_leading_comma():
+    result = parser.parse("x = [, 1]\n")
+    assert result is None
+
+
 def test_array_indexing():
     code = "x = arr[0]\n"
     result = parser.parse(code)
     assert result == [("assign", "x", "=", ("index", ("id", "arr"), ("integer", "0")))]
 
 
-def test_binary_operations():
-    operators = ["+", "-", "*", "/", "%", "**"]
-    for op in operators:
-        code = f"x = a {op} b\n"
-        result = parser.parse(code)
-        assert result == [("assign", "x", "=", ("binop", op, ("id", "a"), ("id", "b")))]
+@pytest.mark.parametrize("op", ["+", "-", "*", "/", "%", "**"])
+def test_binary_operations(op):
+    code = f"x = a {op} b\n"
+    result = parser.parse(code)
+    assert result == [("assign", "x", "=", ("binop", op, ("id", "a"), ("id", "b")))]
 
 
-def test_logical_operations():
-    code = """
+LOGICAL_OPERATIONS = normalize(
+    """
     x = !true
     y = a && b
     z = a || b
     """
-    result = parser.parse(normalize(code))
+)
+
+
+def test_logical_operations():
+    result = parser.parse(LOGICAL_OPERATIONS)
     assert result == [
         ("assign", "x", "=", ("logic_not", ("boolean", "true"))),
         ("assign", "y", "=", ("logic_and", ("id", "a"), ("id", "b"))),
@@ -106,12 +126,11 @@ def test_logical_operations():
     ]
 
 
-def test_comparison_operations():
-    operators = ["==", "!=", "<", ">", "<=", ">="]
-    for op in operators:
-        code = f"x = a {op} b\n"
-        result = parser.parse(code)
-        assert result == [("assign", "x", "=", ("comop", op, ("id", "a"), ("id", "b")))]
+@pytest.mark.parametrize("op", ["==", "!=", "<", ">", "<=", ">="])
+def test_comparison_operations(op):
+    code = f"x = a {op} b\n"
+    result = parser.parse(code)
+    assert result == [("assign", "x", "=", ("comop", op, ("id", "a"), ("id", "b")))]
 
 
 def test_function_calls():
@@ -134,12 +153,16 @@ def test_string_literals():
     assert result == [("assign", "x", "=", ("string", "hello"))]
 
 
-def test_boolean_literals():
-    code = """
+BOOLEAN_LITERALS = normalize(
+    """
     x = true
     y = false
     """
-    result = parser.parse(normalize(code))
+)
+
+
+def test_boolean_literals():
+    result = parser.parse(BOOLEAN_LITERALS)
     assert result == [
         ("assign", "x", "=", ("boolean", "true")),
         ("assign", "y", "=", ("boolean", "false")),
@@ -152,8 +175,8 @@ def test_double_literals():
     assert result == [("assign", "x", "=", ("doublel", "3.14"))]
 
 
-def test_when_statement():
-    code = """
+WHEN_STATEMENT = normalize(
+    """
     when x:
         return 1
     when y:
@@ -161,7 +184,11 @@ def test_when_statement():
     default:
         return 3
     """
-    result = parser.parse(normalize(code))
+)
+
+
+def test_when_statement():
+    result = parser.parse(WHEN_STATEMENT)
     assert result == [
         (
             "when_stmt",
@@ -174,12 +201,16 @@ def test_when_statement():
     ]
 
 
-def test_until_statement():
-    code = """
+UNTIL_STATEMENT = normalize(
+    """
     until x > 10:
         x += 1
     """
-    result = parser.parse(normalize(code))
+)
+
+
+def test_until_statement():
+    result = parser.parse(UNTIL_STATEMENT)
     assert result == [
         (
             "until",
@@ -189,12 +220,16 @@ def test_until_statement():
     ]
 
 
-def test_loop_statement():
-    code = """
+LOOP_STATEMENT = normalize(
+    """
     loop int i in 1..10:
         x += i
     """
-    result = parser.parse(normalize(code))
+)
+
+
+def test_loop_statement():
+    result = parser.parse(LOOP_STATEMENT)
     assert result == [
         (
             "loop",
@@ -218,12 +253,16 @@ def test_conditional_operator():
     ]
 
 
-def test_array_type_declaration():
-    code = """
+ARRAY_TYPE_DECLARATION = normalize(
+    """
     int[] numbers
     str[][] matrix
     """
-    result = parser.parse(normalize(code))
+)
+
+
+def test_array_type_declaration():
+    result = parser.parse(ARRAY_TYPE_DECLARATION)
     assert result == [
         ("declare", ("array", "int"), "numbers"),
         ("declare", ("array", ("array", "str")), "matrix"),
@@ -236,13 +275,17 @@ def test_array_type_declaration():
 #     assert result == [("lambda_func", [("id", "x"), ("id", "y")], ("binop", "+", ("id", "x"), ("id", "y")))]
 
 
-def test_struct_declaration():
-    code = """
+STRUCT_DECLARATION = normalize(
+    """
     struct Point:
         int x
         int y
     """
-    result = parser.parse(normalize(code))
+)
+
+
+def test_struct_declaration():
+    result = parser.parse(STRUCT_DECLARATION)
     assert result == [
         ("struct", "Point", [], [
             ("declare", "int", "x"),
@@ -251,8 +294,8 @@ def test_struct_declaration():
     ]
 
 
-def test_struct_constructor():
-    code = """
+STRUCT_CONSTRUCTOR = normalize(
+    """
     struct Point:
         int x
         int y
@@ -260,7 +303,11 @@ def test_struct_constructor():
             self.x = x
             self.y = y
     """
-    result = parser.parse(normalize(code))
+)
+
+
+def test_struct_constructor():
+    result = parser.parse(STRUCT_CONSTRUCTOR)
     assert result == [
         ("struct", "Point", [], [
             ("declare", "int", "x"),
@@ -274,3 +321,9 @@ def test_struct_constructor():
             ])
         ])
     ]
+
+
+def test_parse_returns_fresh_ast():
+    first = parser.parse("int x\n")
+    first.append(("pass",))
+    assert parser.parse("int x\n") == [("declare", "int", "x")]
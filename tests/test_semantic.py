@@ -1,38 +1,39 @@
 import pytest
+from parser import parser
 from semantic import SemanticAnalyzer, SemanticError
 
 
-def test_simple_declaration():
-    analyzer = SemanticAnalyzer()
+@pytest.fixture
+def analyzer():
+    return SemanticAnalyzer()
+
+
+def test_simple_declaration(analyzer):
     ast = [("declare", "int", "x")]
     analyzer.analyze(ast)
     assert analyzer.symbol_table.lookup("x") == "int"
 
 
-def test_multiple_declarations():
-    analyzer = SemanticAnalyzer()
+def test_multiple_declarations(analyzer):
     ast = [("declare", "int", "x"), ("declare", "str", "y")]
     analyzer.analyze(ast)
     assert analyzer.symbol_table.lookup("x") == "int"
     assert analyzer.symbol_table.lookup("y") == "str"
 
 
-def test_assignment():
-    analyzer = SemanticAnalyzer()
+def test_assignment(analyzer):
     ast = [("declare", "int", "x"), ("assign", "x", "=", ("integer", "42"))]
     analyzer.analyze(ast)
     assert analyzer.symbol_table.lookup("x") == "int"
 
 
-def test_type_mismatch():
-    analyzer = SemanticAnalyzer()
+def test_type_mismatch(analyzer):
     ast = [("declare", "int", "x"), ("assign", "x", "=", ("string", "hello"))]
     with pytest.raises(SemanticError):
         analyzer.analyze(ast)
 
 
-def test_function_declaration():
-    analyzer = SemanticAnalyzer()
+def test_function_declaration(analyzer):
     ast = [
         (
             "func_declare",
@@ -47,8 +48,7 @@ def test_function_declaration():
     assert func_type == ("function", "int", ["int", "int"])
 
 
-def test_function_call():
-    analyzer = SemanticAnalyzer()
+def test_function_call(analyzer):
     ast = [
         (
             "func_declare",
@@ -69,8 +69,7 @@ def test_function_call():
     assert analyzer.symbol_table.lookup("result") == "int"
 
 
-def test_return_type_mismatch():
-    analyzer = SemanticAnalyzer()
+def test_return_type_mismatch(analyzer):
     ast = [
         (
             "func_declare",
@@ -84,46 +83,104 @@ def test_return_type_mismatch():
         analyzer.analyze(ast)
 
 
-def test_enum_declare():
-    analyzer = SemanticAnalyzer()
+def test_enum_declare(analyzer):
     ast = [("enum_declare", "Color", ["RED", "GREEN", "BLUE"])]
     analyzer.analyze(ast)
     assert analyzer.symbol_table.lookup("Color") == "enum"
     assert analyzer.symbol_table.lookup("RED") == "Color"
 
 
-def test_index():
-    analyzer = SemanticAnalyzer()
-    ast = [("declare", "array[int]", "arr"), ("index", ("id", "arr"), ("integer", 0))]
+def test_index(analyzer):
+    ast = [("declare", ("array", "int"), "arr"), ("index", ("id", "arr"), ("integer", 0))]
     analyzer.analyze(ast)
     result = analyzer.analyze_node(ast[1])
     assert result == "int"
 
 
-def test_spread():
-    analyzer = SemanticAnalyzer()
-    ast = [("declare", "array[int]", "arr"), ("spread", ("id", "arr"))]
+def test_spread(analyzer):
+    ast = [("declare", ("array", "int"), "arr"), ("spread", ("id", "arr"))]
     analyzer.analyze(ast)
     result = analyzer.analyze_node(ast[1])
-    assert result == "array[int]"
+    assert result == ("array", "int")
+
+
+def test_index_parsed_array(analyzer):
+    ast = parser.parse("int[] a\nint y\ny = a[0]\n")
+    analyzer.analyze(ast)
+    assert analyzer.symbol_table.lookup("a") == ("array", "int")
+    assert analyzer.symbol_table.lookup("y") == "int"
+
+
+def test_declare_assign_parsed_array_literal(analyzer):
+    ast = parser.parse("int[] a = [1, 2]\n")
+    analyzer.analyze(ast)
+    assert analyzer.symbol_table.lookup("a") == ("array", "int")
+
+
+def test_subclass_handler_override():
+    class RangeAsInt(SemanticAnalyzer):
+        __slots__ = ()
+
+        def analyze_range(self, node):
+            return "int"
 
+    node = ("range", ("integer", "1"), ("integer", "10"))
+    assert RangeAsInt().analyze_node(node) == "int"
+    assert SemanticAnalyzer().analyze_node(node) == "range"
 
-def test_pass():
-    analyzer = SemanticAnalyzer()
+
+def test_empty_array_literal(analyzer):
+    with pytest.raises(SemanticError, match="empty array literal"):
+        analyzer.analyze_node(("array_lit", []))
+
+
+def test_array_literal_mismatch_stops_early(analyzer):
+    # The undeclared id after the mismatch must not be analysed
+    node = ("array_lit", [("integer", "1"), ("string", "a"), ("id", "missing")])
+    with pytest.raises(SemanticError, match="same type"):
+        analyzer.analyze_node(node)
+
+
+def test_pass(analyzer):
     ast = [("pass",)]
     result = analyzer.analyze(ast)
     assert result is None  # Pass statement should not affect analysis
 
 
-# def test_when_stmt():
-#     analyzer = SemanticAnalyzer()
+def test_reanalysis_follows_scope(analyzer):
+    expr = ("binop", "+", ("id", "x"), ("integer", "1"))
+    analyzer.analyze([("declare", "int", "x")])
+    assert analyzer.analyze_node(expr) == "int"
+    analyzer.symbol_table.enter_scope()
+    analyzer.analyze([("declare", "double", "x")])
+    assert analyzer.analyze_node(expr) == "double"
+
+
+def test_exit_scope_restores_shadowed(analyzer):
+    table = analyzer.symbol_table
+    table.declare("x", "int")
+    table.enter_scope()
+    table.declare("x", "double")
+    table.declare("y", "str")
+    assert table.lookup("x") == "double"
+    table.exit_scope()
+    assert table.lookup("x") == "int"
+    with pytest.raises(SemanticError):
+        table.lookup("y")
+
+
+def test_exit_global_scope(analyzer):
+    with pytest.raises(SemanticError):
+        analyzer.symbol_table.exit_scope()
+
+
+# def test_when_stmt(analyzer):
 #     ast = [("when_stmt", [("when", ("boolean", True), [("declare", "int", "x")])])]
 #     analyzer.analyze(ast)
 #     assert analyzer.symbol_table.lookup("x") == "int"
 
 
-# def test_loop():
-#     analyzer = SemanticAnalyzer()
+# def test_loop(analyzer):
 #     ast = [
 #         (
 #             "loop",
@@ -136,64 +193,55 @@ def test_pass():
 #     assert analyzer.symbol_table.lookup("x") == "int"
 
 
-# def test_until():
-#     analyzer = SemanticAnalyzer()
+# def test_until(analyzer):
 #     ast = [("until", ("boolean", True), [("declare", "int", "x")])]
 #     analyzer.analyze(ast)
 #     assert analyzer.symbol_table.lookup("x") == "int"
 
 
-# def test_unary():
-#     analyzer = SemanticAnalyzer()
+# def test_unary(analyzer):
 #     ast = [("unary", "++", ("id", "x"))]
 #     with pytest.raises(SemanticError):
 #         analyzer.analyze(ast)
 
 
-# def test_logic_not():
-#     analyzer = SemanticAnalyzer()
+# def test_logic_not(analyzer):
 #     ast = [("logic_not", ("boolean", True))]
 #     result = analyzer.analyze(ast)
 #     assert result == "bool"
 
 
-# def test_logic_and():
-#     analyzer = SemanticAnalyzer()
+# def test_logic_and(analyzer):
 #     ast = [("logic_and", ("boolean", True), ("boolean", False))]
 #     result = analyzer.analyze(ast)
 #     assert result == "bool"
 
 
-# def test_logic_or():
-#     analyzer = SemanticAnalyzer()
+# def test_logic_or(analyzer):
 #     ast = [("logic_or", ("boolean", True), ("boolean", False))]
 #     result = analyzer.analyze(ast)
 #     assert result == "bool"
 
 
-# def test_comop():
-#     analyzer = SemanticAnalyzer()
+# def test_comop(analyzer):
 #     ast = [("comop", "==", ("integer", 1), ("integer", 1))]
 #     result = analyzer.analyze(ast)
 #     assert result == "bool"
 
 
-# def test_conop():
-#     analyzer = SemanticAnalyzer()
+# def test_conop(analyzer):
 #     ast = [("conop", ("boolean", True), ("integer", 1), ("integer", 0))]
 #     result = analyzer.analyze(ast)
 #     assert result == "int"
 
 
-# def test_cast():
-#     analyzer = SemanticAnalyzer()
+# def test_cast(analyzer):
 #     ast = [("cast", "double", ("integer", 1))]
 #     result = analyzer.analyze(ast)
 #     assert result == "double"
 
 
-# def test_range():
-#     analyzer = SemanticAnalyzer()
+# def test_range(analyzer):
 #     ast = [("range", ("integer", 1), ("integer", 10))]
 #     result = analyzer.analyze(ast)
 #     assert result == "range"